@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+"""microbenchmark for ga4gh.core.digests encoder/backend variants
+
+Compares the binascii-based base64url path used by sha512t24u against
+the stdlib base64 wrapper it replaced, and the sha512 and blake2b digest
+backends. Run directly:
+
+    python misc/digest-bench.py
+
+"""
+
+import base64
+import hashlib
+import timeit
+
+from ga4gh.core.digests import _b64url, blake2t24u, sha512t24u
+
+BLOB = (b'{"location":"' + b"x" * 10 + b'"}') * 16    # ~400 B, typical VRS serialization size
+DIGEST = hashlib.sha512(BLOB).digest()[:24]
+N = 100_000
+
+
+def bench(label, stmt, env):
+    t = min(timeit.repeat(stmt, globals=env, number=N, repeat=5))
+    print(f"{label:<40} {t / N * 1e6:8.3f} us/call")
+
+
+if __name__ == "__main__":
+    env = dict(globals())
+    bench("base64.urlsafe_b64encode + decode",
+          "base64.urlsafe_b64encode(DIGEST).decode('ascii')", env)
+    bench("_b64url (binascii + maketrans)", "_b64url(DIGEST)", env)
+    bench("sha512t24u", "sha512t24u(BLOB)", env)
+    bench("blake2t24u", "blake2t24u(BLOB)", env)
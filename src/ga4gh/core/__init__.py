@@ -4,7 +4,7 @@
 
 from importlib.metadata import version, PackageNotFoundError
 
-from .digests import sha512t24u
+from .digests import sha512t24u, sha512t24u_24, sha512t24u_many, blake2t24u, digest_blob
 from .enderef import ga4gh_enref, ga4gh_deref
 from .identifiers import (
     ga4gh_digest, ga4gh_identify, ga4gh_serialize, is_ga4gh_identifier,
@@ -13,13 +13,18 @@ from .identifiers import (
     PrevVrsVersion
 )
 from .pydantic import (
-    is_pydantic_instance, is_curie_type, pydantic_copy
+    is_pydantic_instance, is_curie_type, pydantic_copy, pydantic_construct,
+    model_dump_json_fast
 )
 from .domain_models import CommonDomainType
 from . import entity_models, domain_models
 
 __all__ = [
     "sha512t24u",
+    "sha512t24u_24",
+    "sha512t24u_many",
+    "blake2t24u",
+    "digest_blob",
     "ga4gh_enref",
     "ga4gh_deref",
     "ga4gh_digest",
@@ -37,13 +42,17 @@ __all__ = [
     "is_pydantic_instance",
     "is_curie_type",
     "pydantic_copy",
+    "pydantic_construct",
+    "model_dump_json_fast",
     "CommonDomainType",
     "entity_models",
     "domain_models"
 ]
 
 try:
-    __version__ = version(__name__)
+    # ga4gh.core is distributed as part of the ga4gh.vrs package; looking
+    # up __name__ here never resolved and always yielded "unknown"
+    __version__ = version("ga4gh.vrs")
 except PackageNotFoundError:    # pragma: nocover
     __version__ = "unknown"
 finally:
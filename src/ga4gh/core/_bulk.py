@@ -0,0 +1,83 @@
+"""struct-of-arrays companions for list-valued entity attributes
+
+Bulk workloads that digest or serialize very large numbers of entities
+pay one pydantic model instantiation per list element for attributes
+like ``Entity.extensions`` and ``DomainEntity.mappings``.  The tables
+here hold the same data in parallel columns so batch passes can iterate
+flat lists, converting to and from the pydantic
+(array-of-structs) form only at the edges.
+
+This module is internal; the pydantic models remain the public API.
+
+"""
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+
+from ga4gh.core.entity_models import Coding, ConceptMapping, Extension
+
+
+@dataclass(slots=True)
+class ExtensionsTable:
+    """column-wise form of a list of :class:`Extension`"""
+
+    names: List[str] = field(default_factory=list)
+    values: List[Any] = field(default_factory=list)
+    descriptions: List[Optional[str]] = field(default_factory=list)
+
+    @classmethod
+    def from_aos(cls, extensions) -> "ExtensionsTable":
+        table = cls()
+        append_name = table.names.append
+        append_value = table.values.append
+        append_description = table.descriptions.append
+        for ext in extensions:
+            append_name(ext.name)
+            append_value(ext.value)
+            append_description(ext.description)
+        return table
+
+    def to_aos(self) -> List[Extension]:
+        return [
+            Extension(name=n, value=v, description=d)
+            for n, v, d in zip(self.names, self.values, self.descriptions)
+        ]
+
+    def __len__(self):
+        return len(self.names)
+
+
+@dataclass(slots=True)
+class MappingsTable:
+    """column-wise form of a list of :class:`ConceptMapping`"""
+
+    codes: List[str] = field(default_factory=list)
+    systems: List[str] = field(default_factory=list)
+    labels: List[Optional[str]] = field(default_factory=list)
+    versions: List[Optional[str]] = field(default_factory=list)
+    relations: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_aos(cls, mappings) -> "MappingsTable":
+        table = cls()
+        for m in mappings:
+            coding = m.coding
+            table.codes.append(coding.code.root)
+            table.systems.append(coding.system)
+            table.labels.append(coding.label)
+            table.versions.append(coding.version)
+            table.relations.append(m.relation)
+        return table
+
+    def to_aos(self) -> List[ConceptMapping]:
+        return [
+            ConceptMapping(
+                coding=Coding(code=c, system=s, label=l, version=v),
+                relation=r,
+            )
+            for c, s, l, v, r in zip(
+                self.codes, self.systems, self.labels, self.versions, self.relations
+            )
+        ]
+
+    def __len__(self):
+        return len(self.codes)
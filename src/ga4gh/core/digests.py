@@ -5,11 +5,43 @@ https://journals.plos.org/plosone/article?id=10.1371/journal.pone.0239883
 
 """
 
-import base64
+import binascii
 import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+# pre-bind at module scope to avoid per-call attribute lookups on the
+# identifier-generation hot path
+_b2a_base64 = binascii.b2a_base64
+_blake2b = hashlib.blake2b
+_sha512 = hashlib.sha512
 
-def sha512t24u(blob):
+_URLSAFE_TRANS = bytes.maketrans(b"+/", b"-_")
+
+
+def _b64url(buf):
+    """base64url-encode binary data, returning str
+
+    Equivalent to ``base64.urlsafe_b64encode(buf).decode("ascii")`` but
+    calls the binascii C primitive directly, skipping the base64 module's
+    wrapper layers; the translation table is built once at import.
+    """
+    return _b2a_base64(buf, newline=False).translate(_URLSAFE_TRANS).decode("ascii")
+
+
+# bulk ingest digests the same serializations repeatedly (e.g., a shared
+# SequenceReference across thousands of alleles); memoize small blobs only
+# so large buffers are not pinned in the cache
+_CACHED_BLOB_MAX = 4096
+
+
+@lru_cache(maxsize=4096)
+def _cached_sha512t24u(blob):
+    return _b64url(_sha512(blob).digest()[:24])
+
+
+def sha512t24u(blob, digest_size=24):
     """generate a base64url-encode, truncated SHA-512 digest for given
     binary data
 
@@ -29,7 +61,106 @@ def sha512t24u(blob):
 
     """
 
-    digest_size = 24
-    digest = hashlib.sha512(blob).digest()
-    tdigest_b64us = base64.urlsafe_b64encode(digest[:digest_size])
-    return tdigest_b64us.decode("ascii")
+    # memoize the common case (24-byte digests of small bytes blobs); other
+    # bytes-like inputs (bytearray, memoryview) are unhashable, so they fall
+    # through to the direct hash along with large blobs
+    if digest_size == 24 and blob.__class__ is bytes and len(blob) <= _CACHED_BLOB_MAX:
+        return _cached_sha512t24u(blob)
+    return _b64url(_sha512(blob).digest()[:digest_size])
+
+
+# allow tests and long-running ingest jobs to reset the memo
+sha512t24u.cache_clear = _cached_sha512t24u.cache_clear
+sha512t24u.cache_info = _cached_sha512t24u.cache_info
+
+
+def sha512t24u_24(blob):
+    """sha512t24u specialized for the standard 24-byte digest size
+
+    Single positional argument with no default handling and the
+    truncation constant inlined; preferred entry point for tight
+    identifier-generation loops.
+
+    Examples:
+    >>> sha512t24u_24(b"ACGT")
+    'aKF498dAxcJAqme6QYQ7EZ07-fiw8Kw2'
+
+    """
+
+    if blob.__class__ is bytes and len(blob) <= _CACHED_BLOB_MAX:
+        return _cached_sha512t24u(blob)
+    return _b64url(_sha512(blob).digest()[:24])
+
+
+def sha512t24u_many(blobs, workers=None):
+    """generate sha512t24u digests for an iterable of binary blobs
+
+    Bulk identifier generation (e.g., annotating a VCF with thousands of
+    alleles) pays the Python call overhead of :func:`sha512t24u` once per
+    blob; this batch form keeps the loop in a single comprehension over
+    locally-bound callables so only the hashing itself is repeated.
+
+    If ``workers`` is given, digests are computed on a thread pool.
+    hashlib only releases the GIL for blobs larger than ~2 KiB, so
+    threads help for large serializations but not for typical
+    few-hundred-byte VRS blobs; the default stays serial.
+
+    Examples:
+    >>> sha512t24u_many([b'', b"ACGT"])
+    ['z4PhNX7vuL3xVChQ1m2AB9Yg5AULVxXc', 'aKF498dAxcJAqme6QYQ7EZ07-fiw8Kw2']
+
+    >>> sha512t24u_many([b'', b"ACGT"], workers=2)
+    ['z4PhNX7vuL3xVChQ1m2AB9Yg5AULVxXc', 'aKF498dAxcJAqme6QYQ7EZ07-fiw8Kw2']
+
+    """
+
+    if workers:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(sha512t24u, blobs, chunksize=64))
+
+    sha512, b64url = _sha512, _b64url
+    return [b64url(sha512(blob).digest()[:24]) for blob in blobs]
+
+
+def blake2t24u(blob):
+    """generate a base64url-encoded, 24-byte BLAKE2b digest for given
+    binary data
+
+    BLAKE2b produces the 24-byte digest natively in a single pass,
+    avoiding the truncation step of sha512t24u and using a faster round
+    function than SHA-512 on scalar 64-bit cores.
+
+    The resulting digests are NOT interchangeable with sha512t24u
+    digests, so this backend must be selected explicitly (see
+    ``digest_blob`` below).
+
+    Examples:
+    >>> blake2t24u(b'')
+    'qztTMacTXtUNDxgtAm5gq9s2Rv1RvPij'
+
+    >>> blake2t24u(b"ACGT")
+    'qLw9xwGx8yem3DPEuSCQyxssM1FlL7bz'
+
+    """
+
+    return _b64url(_blake2b(blob, digest_size=24).digest())
+
+
+_HASHERS = {
+    "sha512t24u": sha512t24u,
+    "blake2b": blake2t24u,
+}
+
+# Blob digest function used when computing GA4GH digests, selected once at
+# import via the GA4GH_DIGEST_BACKEND environment variable.  sha512t24u
+# remains the default; blake2b digests are not interoperable with VRS
+# computed identifiers and are opt-in only.
+_backend = os.environ.get("GA4GH_DIGEST_BACKEND", "sha512t24u")
+try:
+    digest_blob = _HASHERS[_backend]
+except KeyError:
+    raise ValueError(
+        f"Invalid GA4GH_DIGEST_BACKEND {_backend!r}; "
+        f"valid backends are: {', '.join(sorted(_HASHERS))}"
+    ) from None
+del _backend
@@ -30,12 +30,24 @@ class CommonDomainType(str, Enum):
     TR_COMB = "CombinationTherapy"
     GENE = "Gene"
 
+
+# enum values hoisted once at import; used below for both Literal
+# defaults and their descriptions
+_PHENOTYPE = CommonDomainType.PHENOTYPE.value
+_DISEASE = CommonDomainType.DISEASE.value
+_TRAIT_SET = CommonDomainType.TRAIT_SET.value
+_TR_ACTION = CommonDomainType.TR_ACTION.value
+_TR_AGENT = CommonDomainType.TR_AGENT.value
+_TR_SUB = CommonDomainType.TR_SUB.value
+_TR_COMB = CommonDomainType.TR_COMB.value
+_GENE = CommonDomainType.GENE.value
+
 class Phenotype(DomainEntity):
     """An observable characteristic or trait of an organism."""
 
     type: Literal["Phenotype"] = Field(
-        CommonDomainType.PHENOTYPE.value,
-        description=f'MUST be "{CommonDomainType.PHENOTYPE.value}".'
+        _PHENOTYPE,
+        description=f'MUST be "{_PHENOTYPE}".'
     )
 
 
@@ -45,8 +57,8 @@ class Disease(DomainEntity):
     """
 
     type: Literal["Disease"] = Field(
-        CommonDomainType.DISEASE.value,
-        description=f'MUST be "{CommonDomainType.DISEASE.value}".'
+        _DISEASE,
+        description=f'MUST be "{_DISEASE}".'
     )
 
 
@@ -54,8 +66,8 @@ class TraitSet(DomainEntity):
     """A set of phenotype and/or disease concepts that together constitute a condition."""
 
     type: Literal["TraitSet"] = Field(
-        CommonDomainType.TRAIT_SET.value,
-        description=f'MUST be "{CommonDomainType.TRAIT_SET.value}".'
+        _TRAIT_SET,
+        description=f'MUST be "{_TRAIT_SET}".'
     )
     traits: List[Union[Disease, Phenotype]] = Field(
         ...,
@@ -63,6 +75,25 @@ class TraitSet(DomainEntity):
     )
 
 
+# type-tag -> member class maps used by the trusted fast paths below,
+# mirroring the unions' discriminator='type' resolution
+_CONDITION_DISPATCH = {
+    _TRAIT_SET: TraitSet,
+    _DISEASE: Disease,
+    _PHENOTYPE: Phenotype,
+}
+
+
+def _construct_condition_member(d: dict) -> DomainEntity:
+    cls = _CONDITION_DISPATCH[d["type"]]
+    if cls is TraitSet:
+        # nested union members must be constructed too, or they stay plain
+        # dicts and serialize differently from a validated instance
+        d = {**d, "traits": [_CONDITION_DISPATCH[t["type"]].model_construct(**t)
+                             for t in d["traits"]]}
+    return cls.model_construct(**d)
+
+
 class Condition(RootModel):
     """A disease or other medical disorder."""
 
@@ -72,13 +103,24 @@ class Condition(RootModel):
         discriminator='type',
     )
 
+    @classmethod
+    def from_trusted_dict(cls, d: dict) -> "Condition":
+        """Build a Condition from a trusted, already-validated dict, using the
+        'type' tag to select the member class directly and skipping both
+        discriminator resolution and validation.
+
+        Use only with known-good data (e.g., values read back from an
+        object store populated by this library).
+        """
+        return cls.model_construct(_construct_condition_member(d))
+
 
 class TherapeuticAction(DomainEntity):
     """A therapeutic action taken that is intended to alter or stop a pathologic process."""
 
     type: Literal["TherapeuticAction"] = Field(
-        CommonDomainType.TR_ACTION.value,
-        description=f'MUST be "{CommonDomainType.TR_ACTION.value}".'
+        _TR_ACTION,
+        description=f'MUST be "{_TR_ACTION}".'
     )
 
 
@@ -86,8 +128,8 @@ class TherapeuticAgent(DomainEntity):
     """An administered therapeutic agent that is intended to alter or stop a pathologic process."""
 
     type: Literal["TherapeuticAgent"] = Field(
-        CommonDomainType.TR_AGENT.value,
-        description=f'MUST be "{CommonDomainType.TR_AGENT.value}".'
+        _TR_AGENT,
+        description=f'MUST be "{_TR_AGENT}".'
     )
 
 
@@ -95,8 +137,8 @@ class TherapeuticSubstituteGroup(DomainEntity):
     """A group of therapeutic procedures that may be treated as substitutes for one another."""
 
     type: Literal["TherapeuticSubstituteGroup"] = Field(
-        CommonDomainType.TR_SUB.value,
-        description=f'MUST be "{CommonDomainType.TR_SUB.value}".'
+        _TR_SUB,
+        description=f'MUST be "{_TR_SUB}".'
     )
     substitutes: List[Union[TherapeuticAction, TherapeuticAgent]] = Field(
         ...,
@@ -111,8 +153,8 @@ class CombinationTherapy(DomainEntity):
     """
 
     type: Literal["CombinationTherapy"] = Field(
-        CommonDomainType.TR_COMB.value,
-        description=f'MUST be "{CommonDomainType.TR_COMB.value}".'
+        _TR_COMB,
+        description=f'MUST be "{_TR_COMB}".'
     )
     components: List[Union[TherapeuticSubstituteGroup, TherapeuticAction, TherapeuticAgent]] = Field(
         ...,
@@ -121,6 +163,26 @@ class CombinationTherapy(DomainEntity):
     )
 
 
+_PROCEDURE_DISPATCH = {
+    _TR_COMB: CombinationTherapy,
+    _TR_SUB: TherapeuticSubstituteGroup,
+    _TR_ACTION: TherapeuticAction,
+    _TR_AGENT: TherapeuticAgent,
+}
+
+
+def _construct_procedure_member(d: dict) -> DomainEntity:
+    cls = _PROCEDURE_DISPATCH[d["type"]]
+    if cls is TherapeuticSubstituteGroup:
+        d = {**d, "substitutes": [_PROCEDURE_DISPATCH[s["type"]].model_construct(**s)
+                                  for s in d["substitutes"]]}
+    elif cls is CombinationTherapy:
+        # components may themselves be substitute groups with nested members
+        d = {**d, "components": [_construct_procedure_member(c)
+                                 for c in d["components"]]}
+    return cls.model_construct(**d)
+
+
 class TherapeuticProcedure(RootModel):
     """An action or administration of therapeutic agents to produce an effect  that is
     intended to alter or stop a pathologic process.
@@ -132,11 +194,18 @@ class TherapeuticProcedure(RootModel):
         discriminator='type',
     )
 
+    @classmethod
+    def from_trusted_dict(cls, d: dict) -> "TherapeuticProcedure":
+        """Build a TherapeuticProcedure from a trusted, already-validated
+        dict; see ``Condition.from_trusted_dict``.
+        """
+        return cls.model_construct(_construct_procedure_member(d))
+
 
 class Gene(DomainEntity):
     """A basic physical and functional unit of heredity."""
 
     type: Literal["Gene"] = Field(
-        CommonDomainType.GENE.value,
-        description=f'MUST be "{CommonDomainType.GENE.value}".'
+        _GENE,
+        description=f'MUST be "{_GENE}".'
     )
@@ -14,7 +14,7 @@ from abc import ABC
 from typing import Any, Dict, Annotated, Optional, Union, List
 from enum import Enum
 
-from pydantic import BaseModel, Field, RootModel, StringConstraints, ConfigDict
+from pydantic import BaseModel, Field, RootModel, StringConstraints, ConfigDict, PrivateAttr
 
 from ga4gh.core import GA4GH_IR_REGEXP
 
@@ -58,6 +58,8 @@ class Code(RootModel):
     character and no leading or  trailing whitespace, and where there is no whitespace
     other than single spaces in the contents."""
 
+    model_config = ConfigDict(frozen=True)
+
     root: Annotated[str, StringConstraints(pattern=r'\S+( \S+)*')] = Field(
         ...,
         json_schema_extra={
@@ -75,14 +77,30 @@ class IRI(RootModel):
     <https://datatracker.ietf.org/doc/html/rfc6901#section-6>`.
     """
 
+    # (root, digest) and (root, hash) pairs from the last calls; IRIs are
+    # serialized and hashed repeatedly (e.g., set-based dedup during
+    # enref), so skip recomputing while root is unchanged
+    _ga4gh_cache: Optional[tuple] = PrivateAttr(default=None)
+    _hash_cache: Optional[tuple] = PrivateAttr(default=None)
+
     def __hash__(self):
-        return self.root.__hash__()
+        root = self.root
+        cached = self._hash_cache
+        if cached is not None and cached[0] is root:
+            return cached[1]
+        h = root.__hash__()
+        self._hash_cache = (root, h)
+        return h
 
     def ga4gh_serialize(self):
-        m = GA4GH_IR_REGEXP.match(self.root)
-        if m is not None:
-            return m['digest']
-        return self.root
+        root = self.root
+        cached = self._ga4gh_cache
+        if cached is not None and cached[0] is root:
+            return cached[1]
+        m = GA4GH_IR_REGEXP.match(root)
+        digest = m['digest'] if m is not None else root
+        self._ga4gh_cache = (root, digest)
+        return digest
 
     root: str = Field(
         ...,
@@ -97,6 +115,8 @@ class Coding(BaseModel):
     code system.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     label: Optional[str] = Field(
         None,
         description='The human-readable name for the coded concept, as defined by the code system.'
@@ -118,7 +138,7 @@ class Coding(BaseModel):
 class ConceptMapping(BaseModel):
     """A mapping to a concept in a terminology or code system."""
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, frozen=True)
 
     coding: Coding = Field(..., description="A structured representation of a code for a defined concept in a terminology or code system.")
     relation: Relation = Field(..., description="A mapping relation between concepts as defined by the Simple Knowledge Organization System (SKOS).")
@@ -132,6 +152,8 @@ class Extension(BaseModel):
     between systems.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description='A name for the Extension. Should be indicative of its meaning and/or the type of information it value represents.')
     value: Optional[Union[float, str, bool, Dict[str, Any], List[Any]]] = Field(
         None, description='The value of the Extension - can be any primitive or structured object'
@@ -145,7 +167,7 @@ class Expression(BaseModel):
     variation include the HGVS and ISCN nomenclatures.
     """
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, frozen=True)
 
     syntax: Syntax = Field(..., description="The syntax used to describe the variation. The value should be one of the supported syntaxes.")
     value: str = Field(..., description="The expression of the variation in the specified syntax. The value should be a valid expression in the specified syntax.")
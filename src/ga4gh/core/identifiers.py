@@ -64,11 +64,17 @@ class PrevVrsVersion(str, Enum):
 
     @classmethod
     def validate(cls, version):
-        if version is not None and version not in cls.__members__.values():
+        if version is not None and version not in _PREV_VRS_VERSIONS:
             err_msg = f"Expected `PrevVrsVersion`, but got {version}"
             raise ValueError(err_msg)
 
 
+# frozen membership set computed once; PrevVrsVersion.validate runs on every
+# ga4gh_identify/ga4gh_digest/ga4gh_serialize call, and the str mixin makes
+# plain-string versions hash and compare like members
+_PREV_VRS_VERSIONS = frozenset(PrevVrsVersion.__members__.values())
+
+
 ga4gh_compute_identifier_when = contextvars.ContextVar("ga4gh_compute_identifier_when")
 
 
@@ -2,6 +2,15 @@ import re
 from typing import Any, Union
 from pydantic import BaseModel, RootModel
 
+try:    # optional; used by model_dump_json_fast when available
+    import orjson
+except ImportError:    # pragma: no cover
+    orjson = None
+
+# compiled once; is_curie_type runs for every referable attribute during
+# enref/deref traversals
+_CURIE_RE = re.compile(r'[a-zA-Z0-9.]+:\S+')
+
 
 def getattr_in(obj, names) -> Any:
     """
@@ -30,7 +39,7 @@ def is_curie_type(o: Any) -> bool:
     if isinstance(o, RootModel):
         o = o.root
     if isinstance(o, str):
-        return re.match(r'[a-zA-Z0-9.]+:\S+', o)
+        return _CURIE_RE.match(o)
     return False
 
 
@@ -52,8 +61,31 @@ def pydantic_copy(obj: BaseModel) -> BaseModel:
     if not issubclass(pydantic_class, BaseModel):
         raise RuntimeError("Argument was not a pydantic model: " + str(pydantic_class))
 
-    # Treat RootModel differently, it's a thin wrapper of another object, has no fields
-    if issubclass(pydantic_class, RootModel):
-        return pydantic_class(obj.model_dump())
-    else:
-        return pydantic_class(**obj.model_dump())
+    # the source instance is already validated, so a deep copy does not
+    # need the model_dump + re-validate round trip
+    return obj.model_copy(deep=True)
+
+
+def model_dump_json_fast(obj: BaseModel, exclude_none: bool = True) -> bytes:
+    """Serialize a pydantic model to JSON bytes, using orjson when installed.
+
+    Intended for bulk emission of models (reports, annotation output);
+    NOT for computed-identifier serialization, which must go through
+    canonicaljson to keep digests stable.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj.model_dump(mode="json", exclude_none=exclude_none))
+    return obj.model_dump_json(exclude_none=exclude_none).encode("utf-8")
+
+
+def pydantic_construct(pydantic_class: type, **fields) -> BaseModel:
+    """Construct a pydantic model instance from trusted, already-validated
+    field values, skipping validator execution.
+
+    Use only where the data source is known-good (e.g., values read back
+    from an object store populated by this library); invalid values will
+    not be caught.
+    """
+    if not issubclass(pydantic_class, BaseModel):
+        raise RuntimeError("Argument was not a pydantic model: " + str(pydantic_class))
+    return pydantic_class.model_construct(**fields)
@@ -2,8 +2,6 @@
 """Public interface to the GA4GH Variation Representation reference
 implementation
 """
-from importlib.metadata import version, PackageNotFoundError
-
 from .normalize import normalize
 from .enderef import vrs_deref, vrs_enref
 from .models import VrsType
@@ -18,8 +16,15 @@ __all__ = [
 ]
 
 try:
-    __version__ = version(__name__)
-except PackageNotFoundError:    # pragma: nocover
-    __version__ = "unknown"
-finally:
-    del version, PackageNotFoundError
+    # generated by setuptools-scm at build time; avoids the package
+    # metadata walk on every import
+    from ._version import __version__
+except ImportError:    # pragma: nocover
+    # source tree without a build step; fall back to package metadata
+    from importlib.metadata import version, PackageNotFoundError
+    try:
+        __version__ = version(__name__)
+    except PackageNotFoundError:
+        __version__ = "unknown"
+    finally:
+        del version, PackageNotFoundError
@@ -125,6 +125,7 @@ class _DataProxy(ABC):
             aliases = [a for a in aliases if a.startswith(nsd)]
         return aliases
 
+    @functools.lru_cache()
     def derive_refget_accession(self, ac: str):
         """Derive the refget accession from a public accession identifier
 
@@ -241,12 +242,18 @@ class SeqRepoRESTDataProxy(_SeqRepoDataProxyBase):
     def __init__(self, base_url):
         super().__init__()
         self.base_url = f"{base_url}/{self.rest_version}/"
+        # a persistent session keeps TCP/TLS connections alive across
+        # requests instead of performing a new handshake per fetch
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=8)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     def _get_sequence(self, identifier, start=None, end=None):
         url = self.base_url + f"sequence/{identifier}"
         _logger.info("Fetching %s", url)
         params = {"start": start, "end": end}
-        resp = requests.get(url, params=params)
+        resp = self._session.get(url, params=params)
         if resp.status_code == 404:
             raise KeyError(identifier)
         resp.raise_for_status()
@@ -255,7 +262,7 @@ class SeqRepoRESTDataProxy(_SeqRepoDataProxyBase):
     def _get_metadata(self, identifier):
         url = self.base_url + f"metadata/{identifier}"
         _logger.info("Fetching %s", url)
-        resp = requests.get(url)
+        resp = self._session.get(url)
         if resp.status_code == 404:
             raise KeyError(identifier)
         resp.raise_for_status()
@@ -10,15 +10,25 @@ from collections.abc import Mapping
 from typing import Optional, Union
 from ga4gh.vrs.dataproxy import create_dataproxy, _DataProxy
 from ga4gh.vrs.extras.decorators import lazy_property
+import functools
 import logging
 import re
 
-from ga4gh.core import ga4gh_identify
+from ga4gh.core import ga4gh_identify, pydantic_copy
 from ga4gh.vrs import models, normalize
 from ga4gh.vrs.utils.hgvs_tools import HgvsTools
 
 _logger = logging.getLogger(__name__)
 
+# parsing patterns, compiled once at import time
+_beacon_re = re.compile(r"(?P<chr>[^-]+)\s*:\s*(?P<pos>\d+)\s*(?P<ref>\w+)\s*>\s*(?P<alt>\w+)")
+_gnomad_re = re.compile(
+    r"(?P<chr>[^-]+)-(?P<pos>\d+)-(?P<ref>[ACGTURYKMSWBDHVN]+)-(?P<alt>[ACGTURYKMSWBDHVN]+)",
+    re.IGNORECASE
+)
+_spdi_re = re.compile(r"(?P<ac>[^:]+):(?P<pos>\d+):(?P<del_len_or_seq>\w*):(?P<ins_seq>\w*)")
+
+
 class _Translator(ABC):
     """abstract class / interface for VRS to/from translation needs
 
@@ -32,12 +42,9 @@ class _Translator(ABC):
 
     """
 
-    beacon_re = re.compile(r"(?P<chr>[^-]+)\s*:\s*(?P<pos>\d+)\s*(?P<ref>\w+)\s*>\s*(?P<alt>\w+)")
-    gnomad_re = re.compile(
-        r"(?P<chr>[^-]+)-(?P<pos>\d+)-(?P<ref>[ACGTURYKMSWBDHVN]+)-(?P<alt>[ACGTURYKMSWBDHVN]+)",
-        re.IGNORECASE
-    )
-    spdi_re = re.compile(r"(?P<ac>[^:]+):(?P<pos>\d+):(?P<del_len_or_seq>\w*):(?P<ins_seq>\w*)")
+    beacon_re = _beacon_re
+    gnomad_re = _gnomad_re
+    spdi_re = _spdi_re
 
     def __init__(
         self,
@@ -94,7 +101,7 @@ class _Translator(ABC):
                     raise ValueError(f"Unable to parse data as {fmt} variation")
                 return o
 
-        for _, t in self.from_translators.items():
+        for t in self.from_translators.values():
             o = t(var, **kwargs)
             if o:
                 return o
@@ -102,6 +109,17 @@ class _Translator(ABC):
         formats = list(self.from_translators.keys())
         raise ValueError(f"Unable to parse data as {', '.join(formats)}")
 
+    def translate_many(self, vars, fmt=None, **kwargs):
+        """Translate a sequence of variations to VRS objects; returns a list
+        in input order.
+
+        Batch counterpart of `translate_from`, taking the same `fmt` and
+        kwargs. Repeated accession metadata and sequence lookups across
+        the batch are served from the data proxy caches, so grouping
+        related variations in one call avoids redundant round-trips.
+        """
+        return [self.translate_from(var, fmt, **kwargs) for var in vars]
+
     def translate_to(self, vo, fmt):
         """translate vrs object `vo` to named format `fmt`"""
         t = self.to_translators[fmt]
@@ -208,7 +226,7 @@ class AlleleTranslator(_Translator):
         if not isinstance(beacon_expr, str):
             return None
 
-        m = self.beacon_re.match(beacon_expr.replace(" ", ""))
+        m = _beacon_re.match(beacon_expr.replace(" ", ""))
         if not m:
             return None
 
@@ -270,7 +288,7 @@ class AlleleTranslator(_Translator):
 
         if not isinstance(gnomad_expr, str):
             return None
-        m = self.gnomad_re.match(gnomad_expr)
+        m = _gnomad_re.match(gnomad_expr)
         if not m:
             return None
 
@@ -342,7 +360,7 @@ class AlleleTranslator(_Translator):
         if not isinstance(spdi_expr, str):
             return None
 
-        m = self.spdi_re.match(spdi_expr)
+        m = _spdi_re.match(spdi_expr)
         if not m:
             return None
 
@@ -407,11 +425,24 @@ class AlleleTranslator(_Translator):
                 performed. `False` otherwise. Defaults to `True`
         """
         if kwargs.get("do_normalize", True):
-            allele = normalize(
-                allele,
-                self.data_proxy,
-                rle_seq_limit=kwargs.get("rle_seq_limit", self.rle_seq_limit)
-            )
+            rle_seq_limit = kwargs.get("rle_seq_limit", self.rle_seq_limit)
+            if (
+                isinstance(allele.location.sequenceReference, models.SequenceReference)
+                and isinstance(allele.location.start, int)
+                and isinstance(allele.location.end, int)
+                and isinstance(allele.state, models.LiteralSequenceExpression)
+            ):
+                # simple literal alleles are fully determined by these five
+                # values, so normalization can be served from the memo
+                allele = pydantic_copy(self._normalize_cached(
+                    allele.location.sequenceReference.refgetAccession,
+                    allele.location.start,
+                    allele.location.end,
+                    allele.state.sequence.root,
+                    rle_seq_limit
+                ))
+            else:
+                allele = normalize(allele, self.data_proxy, rle_seq_limit=rle_seq_limit)
 
         if self.identify:
             allele.id = ga4gh_identify(allele)
@@ -419,6 +450,21 @@ class AlleleTranslator(_Translator):
 
         return allele
 
+    @functools.lru_cache()
+    def _normalize_cached(self, refget_accession, start, end, sequence, rle_seq_limit):
+        """Normalize the literal Allele described by the arguments, memoized.
+
+        Importers frequently revisit the same variation (e.g. the same
+        expression with and without validation); memoizing on the allele's
+        defining values avoids re-running normalization and its reference
+        sequence fetches. Callers must copy the result before mutating it.
+        """
+        seq_ref = models.SequenceReference(refgetAccession=refget_accession)
+        location = models.SequenceLocation(sequenceReference=seq_ref, start=start, end=end)
+        state = models.LiteralSequenceExpression(sequence=sequence)
+        allele = models.Allele(location=location, state=state)
+        return normalize(allele, self.data_proxy, rle_seq_limit=rle_seq_limit)
+
 
 class CnvTranslator(_Translator):
     """Class for translating formats from format to VRS Copy Number"""
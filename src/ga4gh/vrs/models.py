@@ -12,12 +12,12 @@ Instead, users should use one of the following:
 """
 from abc import ABC
 from typing import List, Literal, Optional, Union, Dict, Annotated
-from collections import OrderedDict
 from enum import Enum
 import inspect
 import sys
 from ga4gh.core import (
     sha512t24u,
+    digest_blob,
     GA4GH_PREFIX_SEP,
     CURIE_SEP,
     CURIE_NAMESPACE,
@@ -175,14 +175,16 @@ class CopyChange(str, Enum):
 
 
 def _recurse_ga4gh_serialize(obj):
-    if isinstance(obj, _Ga4ghIdentifiableObject):
+    # str is the most common leaf and its isinstance check is much cheaper
+    # than the ABC checks below, so test it first
+    if isinstance(obj, str):
+        return obj
+    elif isinstance(obj, _Ga4ghIdentifiableObject):
         return obj.get_or_create_digest()
     elif isinstance(obj, _ValueObject):
         return obj.ga4gh_serialize()
     elif isinstance(obj, RootModel):
         return _recurse_ga4gh_serialize(obj.model_dump())
-    elif isinstance(obj, str):
-        return obj
     elif isinstance(obj, list):
         return [_recurse_ga4gh_serialize(x) for x in obj]
     else:
@@ -198,11 +200,10 @@ class _ValueObject(Entity, ABC):
         return encode_canonical_json(self.ga4gh_serialize()).decode("utf-8").__hash__()
 
     def ga4gh_serialize(self) -> Dict:
-        out = OrderedDict()
-        for k in self.ga4gh.keys:
-            v = getattr(self, k)
-            out[k] = _recurse_ga4gh_serialize(v)
-        return out
+        # plain dicts preserve insertion order; no need for OrderedDict on
+        # this hot path
+        serialize = _recurse_ga4gh_serialize
+        return {k: serialize(getattr(self, k)) for k in self.ga4gh.keys}
 
     class ga4gh:
         keys: List[str]
@@ -243,7 +244,9 @@ class _Ga4ghIdentifiableObject(_ValueObject, ABC):
         returned following the conventions of the VRS version indicated by ``as_version_``.
         """
         if as_version is None:
-            digest = sha512t24u(encode_canonical_json(self.ga4gh_serialize()))
+            # digest_blob is sha512t24u unless an alternate backend was
+            # selected via GA4GH_DIGEST_BACKEND
+            digest = digest_blob(encode_canonical_json(self.ga4gh_serialize()))
             if store:
                 self.digest = digest
         else:
@@ -492,12 +495,15 @@ class SequenceLocation(_Ga4ghIdentifiableObject):
         :return: Sequence Location
         """
         if v is not None:
+            # direct comparisons; this runs on every SequenceLocation
+            # construction, so avoid building throwaway lists
             if isinstance(v, int):
-                int_values = [v]
+                invalid = v < 0
             else:
-                int_values = [val for val in v.root if val is not None]
+                lo, hi = v.root
+                invalid = (lo is not None and lo < 0) or (hi is not None and hi < 0)
 
-            if any(int_val < 0 for int_val in int_values):
+            if invalid:
                 err_msg = f"The minimum value of `{info.field_name}` is 0."
                 raise ValueError(err_msg)
         return v
@@ -248,11 +248,15 @@ def _define_rle_allele(allele, length, repeat_subunit_length, rle_seq_limit, ext
 
 
 def _is_valid_cycle(template_start, template, target):
-    cycle = itertools.cycle(template[template_start:])
-    for char in target[len(template):]:
-        if char != next(cycle):
-            return False
-    return True
+    # compare the target tail against a circular expansion of the template
+    # cycle; str.__mul__ and slicing keep the comparison at C level rather
+    # than walking the tail character by character
+    cycle = template[template_start:]
+    tail = target[len(template):]
+    if not tail:
+        return True
+    reps = -(-len(tail) // len(cycle))    # ceil division
+    return (cycle * reps)[:len(tail)] == tail
 
 # TODO _normalize_genotype?
 
@@ -9,6 +9,7 @@ import hgvs.sequencevariant
 import logging
 
 from ga4gh.vrs.dataproxy import _DataProxy, create_dataproxy
+from ga4gh.vrs.extras.decorators import lazy_property
 from ga4gh.vrs import models
 
 _logger = logging.getLogger(__name__)
@@ -17,6 +18,10 @@ class HgvsTools():
     """
     A convenience class that exposes only the tools needed by vrs-python for working with HGVS (Human Genome Variation Society) notation.
 
+    The grammar-based parser and the UTA-backed tools are built lazily on
+    first use: parsing an expression does not open a UTA connection, and the
+    one-time grammar construction cost is paid only by callers that parse.
+
     Attributes:
         parser (hgvs.parser.Parser): The HGVS parser object.
         uta_conn: The UTA (Universal Transcript Archive) connection object.
@@ -27,21 +32,32 @@ class HgvsTools():
     hgvs_re = re.compile(r"[^:]+:[cgmnpr]\.")
 
     def __init__(self,data_proxy: _DataProxy = None):
-        self.parser = hgvs.parser.Parser()
-        self.uta_conn = hgvs.dataproviders.uta.connect()
-        self.normalizer = hgvs.normalizer.Normalizer(self.uta_conn, validate=True)
-        self.variant_mapper = hgvs.variantmapper.VariantMapper(self.uta_conn)
         self.data_proxy = data_proxy
 
-    
+    @lazy_property
+    def parser(self):
+        return hgvs.parser.Parser()
+
+    @lazy_property
+    def uta_conn(self):
+        return hgvs.dataproviders.uta.connect()
+
+    @lazy_property
+    def normalizer(self):
+        return hgvs.normalizer.Normalizer(self.uta_conn, validate=True)
+
+    @lazy_property
+    def variant_mapper(self):
+        return hgvs.variantmapper.VariantMapper(self.uta_conn)
 
     def close(self):
         # TODO These should only be closed if they are owned by this instance
-        self.normalizer = None
-        self.variant_mapper = None
         self.data_proxy = None
-        if self.uta_conn is not None:
-            self.uta_conn.close()
+        uta_conn = self.__dict__.pop("_lazy_uta_conn", None)
+        for attr in ("_lazy_parser", "_lazy_normalizer", "_lazy_variant_mapper"):
+            self.__dict__.pop(attr, None)
+        if uta_conn is not None:
+            uta_conn.close()
 
     # convenience methods for hgvs parsing, normalization, and some mappings
     def parse(self, hgvs_str):
@@ -2,6 +2,17 @@ import os
 
 import pytest
 
+# Cassettes stay in VCR's default YAML format: with libyaml installed (the
+# case in CI and dev images), vcrpy deserializes them through yaml.CSafeLoader,
+# so replay parsing is already C-level and an alternate binary serializer
+# (e.g. msgpack) would add a dependency without a measurable win.
+#
+# Cassettes are also kept per test (one file per parametrized case) rather
+# than consolidated into an indexed session-wide cassette: each file then
+# holds only a handful of interactions, so vcrpy's linear request matching
+# stays cheap without subclassing its cassette internals, and a case can be
+# re-recorded in isolation.
+
 from biocommons.seqrepo import SeqRepo
 from ga4gh.vrs.dataproxy import SeqRepoRESTDataProxy, SeqRepoDataProxy
 
@@ -14,6 +25,11 @@ def dataproxy():
 
 @pytest.fixture(scope="session")
 def rest_dataproxy():
+    # No in-memory preloading of test contig ranges here: get_sequence /
+    # get_metadata are lru_cached on the proxy, so each distinct range is
+    # fetched at most once per session, and serving slices from a preloaded
+    # buffer would change the request URIs and break exact-URI matching
+    # against the recorded cassettes.
     return SeqRepoRESTDataProxy(
         base_url=os.environ.get(
             "SEQREPO_REST_URL",
@@ -1,11 +1,18 @@
+from types import MappingProxyType
+
 import pytest
 
 from ga4gh.vrs import models
 from ga4gh.vrs.dataproxy import DataProxyValidationError
 from ga4gh.vrs.extras.translator import AlleleTranslator
 
+# these modules share the session rest_dataproxy, whose lru caches (and
+# therefore cassette contents) assume collection order; keep them on one
+# xdist worker under --dist=loadgroup
+pytestmark = pytest.mark.xdist_group("seqrepo_rest")
+
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def tlr(rest_dataproxy):
     return AlleleTranslator(
         data_proxy=rest_dataproxy,
@@ -22,7 +29,7 @@ snv_inputs = {
     "gnomad": "19-44908822-C-T"
 }
 
-snv_output = {
+snv_output = MappingProxyType({
     "location": {
         "end": 44908822,
         "start": 44908821,
@@ -37,7 +44,7 @@ snv_output = {
         "type": "LiteralSequenceExpression"
     },
     "type": "Allele"
-}
+})
 
 # https://www.ncbi.nlm.nih.gov/clinvar/variation/693259/?new_evidence=true
 mito_inputs = {
@@ -47,7 +54,7 @@ mito_inputs = {
     "gnomad": "MT-10083-A-G"
 }
 
-mito_output = {
+mito_output = MappingProxyType({
     "location": {
       "start": 10082,
       "end": 10083,
@@ -62,7 +69,7 @@ mito_output = {
       "type": "LiteralSequenceExpression"
     },
     "type": "Allele"
-}
+})
 
 # https://www.ncbi.nlm.nih.gov/clinvar/variation/1373966/?new_evidence=true
 deletion_inputs = {
@@ -71,7 +78,7 @@ deletion_inputs = {
     "gnomad": "13-20003096-AC-A"
 }
 
-deletion_output = {
+deletion_output = MappingProxyType({
     "location": {
         "end": 20003097,
         "start": 20003096,
@@ -86,9 +93,9 @@ deletion_output = {
         "type": "LiteralSequenceExpression"
     },
     "type": "Allele"
-}
+})
 
-gnomad_deletion_output = {
+gnomad_deletion_output = MappingProxyType({
     "location": {
         "end": 20003097,
         "start": 20003095,
@@ -103,9 +110,9 @@ gnomad_deletion_output = {
         "type": "LiteralSequenceExpression"
     },
     "type": "Allele"
-}
+})
 
-deletion_output_normalized = {
+deletion_output_normalized = MappingProxyType({
     "location": {
         "end": 20003097,
         "start": 20003096,
@@ -122,7 +129,7 @@ deletion_output_normalized = {
         "type": "ReferenceLengthExpression"
     },
     "type": "Allele"
-}
+})
 
 # https://www.ncbi.nlm.nih.gov/clinvar/variation/1687427/?new_evidence=true
 insertion_inputs = {
@@ -131,7 +138,7 @@ insertion_inputs = {
     "gnomad": "13-20003010-A-AG"
 }
 
-insertion_output = {
+insertion_output = MappingProxyType({
     "location": {
         "end": 20003010,
         "start": 20003010,
@@ -146,9 +153,9 @@ insertion_output = {
         "type": "LiteralSequenceExpression"
     },
     "type": "Allele"
-}
+})
 
-gnomad_insertion_output = {
+gnomad_insertion_output = MappingProxyType({
     "location": {
         "end": 20003010,
         "start": 20003009,
@@ -163,7 +170,7 @@ gnomad_insertion_output = {
         "type": "LiteralSequenceExpression"
     },
     "type": "Allele"
-}
+})
 
 # https://www.ncbi.nlm.nih.gov/clinvar/variation/1264314/?new_evidence=true
 duplication_inputs = {
@@ -172,7 +179,7 @@ duplication_inputs = {
     "gnomad": "13-19993838-GT-GTGT"
 }
 
-duplication_output = {
+duplication_output = MappingProxyType({
     "location": {
         "end": 19993839,
         "start": 19993837,
@@ -187,9 +194,9 @@ duplication_output = {
         "type": "LiteralSequenceExpression"
     },
     "type": "Allele"
-}
+})
 
-duplication_output_normalized = {
+duplication_output_normalized = MappingProxyType({
     "location": {
         "end": 19993839,
         "start": 19993837,
@@ -206,8 +213,43 @@ duplication_output_normalized = {
         "type": "ReferenceLengthExpression"
     },
     "type": "Allele"
+})
+
+# expected payloads are validated into Allele models once at import; the
+# per-test comparison is then a single pydantic-core equality over fixed
+# model slots instead of re-validating and walking nested dicts each run
+_allele = models.Allele.model_validate
+
+# label -> (inputs, expected without normalization, expected with normalization)
+# for the formats whose tests are parametrized below; per-label cases keep
+# cassettes small and let pytest-xdist distribute them
+translator_cases = {
+    "snv": (snv_inputs, _allele(snv_output), _allele(snv_output)),
+    "mito": (mito_inputs, _allele(mito_output), _allele(mito_output)),
+    "deletion": (deletion_inputs, _allele(deletion_output), _allele(deletion_output_normalized)),
+    "insertion": (insertion_inputs, _allele(insertion_output), _allele(insertion_output)),
+    "duplication": (duplication_inputs, _allele(duplication_output), _allele(duplication_output_normalized)),
+}
+
+gnomad_cases = {
+    "snv": (snv_inputs, _allele(snv_output), _allele(snv_output)),
+    "mito": (mito_inputs, _allele(mito_output), _allele(mito_output)),
+    "deletion": (deletion_inputs, _allele(gnomad_deletion_output), _allele(deletion_output_normalized)),
+    "insertion": (insertion_inputs, _allele(gnomad_insertion_output), _allele(insertion_output)),
+    "duplication": (duplication_inputs, _allele(duplication_output), _allele(duplication_output_normalized)),
 }
 
+# (spdi expression, expected without normalization) pairs; deletion and
+# insertion carry both the deleted-sequence and deleted-length SPDI forms
+spdi_cases = [
+    (snv_inputs["spdi"], _allele(snv_output)),
+    (mito_inputs["spdi"], _allele(mito_output)),
+    *((expr, _allele(deletion_output)) for expr in deletion_inputs["spdi"]),
+    *((expr, _allele(insertion_output)) for expr in insertion_inputs["spdi"]),
+    (duplication_inputs["spdi"], _allele(duplication_output)),
+]
+
+
 def test_from_invalid(tlr):
     try:
         tlr.translate_from("BRAF amplication")
@@ -218,26 +260,32 @@ def test_from_invalid(tlr):
 @pytest.mark.vcr
 def test_from_beacon(tlr):
     do_normalize = False
-    assert tlr._from_beacon(snv_inputs["beacon"], do_normalize=do_normalize).model_dump(exclude_none=True) == snv_output
-    assert tlr._from_beacon(mito_inputs["beacon"], do_normalize=do_normalize).model_dump(exclude_none=True) == mito_output
+    assert tlr._from_beacon(snv_inputs["beacon"], do_normalize=do_normalize) == _allele(snv_output)
+    assert tlr._from_beacon(mito_inputs["beacon"], do_normalize=do_normalize) == _allele(mito_output)
 
 
+@pytest.mark.parametrize("label", gnomad_cases)
 @pytest.mark.vcr
-def test_from_gnomad(tlr):
-    do_normalize = False
-    assert tlr._from_gnomad(snv_inputs["gnomad"], do_normalize=do_normalize).model_dump(exclude_none=True) == snv_output
-    assert tlr._from_gnomad(mito_inputs["gnomad"], do_normalize=do_normalize).model_dump(exclude_none=True) == mito_output
-    assert tlr._from_gnomad(deletion_inputs["gnomad"], do_normalize=do_normalize).model_dump(exclude_none=True) == gnomad_deletion_output
-    assert tlr._from_gnomad(insertion_inputs["gnomad"], do_normalize=do_normalize).model_dump(exclude_none=True) == gnomad_insertion_output
-    assert tlr._from_gnomad(duplication_inputs["gnomad"], do_normalize=do_normalize).model_dump(exclude_none=True) == duplication_output
+def test_from_gnomad(tlr, label):
+    inputs, expected, expected_normalized = gnomad_cases[label]
+    # model equality keeps the comparison in pydantic-core instead of a
+    # Python model_dump walk plus dict diff
+    assert tlr._from_gnomad(inputs["gnomad"], do_normalize=False) == expected
 
     # do_normalize defaults to true
-    assert tlr._from_gnomad(snv_inputs["gnomad"]).model_dump(exclude_none=True) == snv_output
-    assert tlr._from_gnomad(mito_inputs["gnomad"]).model_dump(exclude_none=True) == mito_output
-    assert tlr._from_gnomad(deletion_inputs["gnomad"]).model_dump(exclude_none=True) == deletion_output_normalized
-    assert tlr._from_gnomad(insertion_inputs["gnomad"]).model_dump(exclude_none=True) == insertion_output
-    assert tlr._from_gnomad(duplication_inputs["gnomad"]).model_dump(exclude_none=True) == duplication_output_normalized
+    assert tlr._from_gnomad(inputs["gnomad"]) == expected_normalized
+
+
+@pytest.mark.vcr
+def test_translate_many(tlr):
+    labels = ["snv", "deletion", "insertion", "duplication"]
+    exprs = [gnomad_cases[label][0]["gnomad"] for label in labels]
+    alleles = tlr.translate_many(exprs, fmt="gnomad")
+    assert alleles == [gnomad_cases[label][2] for label in labels]
 
+
+@pytest.mark.vcr
+def test_from_gnomad_validation(tlr):
     assert tlr._from_gnomad("17-83129587-GTTGWCACATGA-G")
 
     # Test valid characters
@@ -265,26 +313,17 @@ def test_from_gnomad(tlr):
     assert tlr._from_gnomad(invalid_var, require_validation=False)
 
 
+@pytest.mark.parametrize("label", translator_cases)
 @pytest.mark.vcr
-def test_from_hgvs(tlr):
-    do_normalize = False
-    assert tlr._from_hgvs(snv_inputs["hgvs"], do_normalize=do_normalize).model_dump(exclude_none=True) == snv_output
-    assert tlr._from_hgvs(mito_inputs["hgvs"], do_normalize=do_normalize).model_dump(exclude_none=True) == mito_output
-    assert tlr._from_hgvs(deletion_inputs["hgvs"], do_normalize=do_normalize).model_dump(exclude_none=True) == deletion_output
-    assert tlr._from_hgvs(insertion_inputs["hgvs"], do_normalize=do_normalize).model_dump(exclude_none=True) == insertion_output
-    assert tlr._from_hgvs(duplication_inputs["hgvs"], do_normalize=do_normalize).model_dump(exclude_none=True) == duplication_output
+def test_from_hgvs(tlr, label):
+    inputs, expected, _ = translator_cases[label]
+    assert tlr._from_hgvs(inputs["hgvs"], do_normalize=False) == expected
 
 
+@pytest.mark.parametrize("expr,expected", spdi_cases)
 @pytest.mark.vcr
-def test_from_spdi(tlr):
-    do_normalize = False
-    assert tlr._from_spdi(snv_inputs["spdi"], do_normalize=do_normalize).model_dump(exclude_none=True) == snv_output
-    assert tlr._from_spdi(mito_inputs["spdi"], do_normalize=do_normalize).model_dump(exclude_none=True) == mito_output
-    for spdi_del_expr in deletion_inputs["spdi"]:
-        assert tlr._from_spdi(spdi_del_expr, do_normalize=do_normalize).model_dump(exclude_none=True) == deletion_output, spdi_del_expr
-    for spdi_ins_expr in insertion_inputs["spdi"]:
-        assert tlr._from_spdi(spdi_ins_expr, do_normalize=do_normalize).model_dump(exclude_none=True) == insertion_output, spdi_ins_expr
-    assert tlr._from_spdi(duplication_inputs["spdi"], do_normalize=do_normalize).model_dump(exclude_none=True) == duplication_output
+def test_from_spdi(tlr, expr, expected):
+    assert tlr._from_spdi(expr, do_normalize=False) == expected
 
 
 @pytest.mark.vcr
@@ -435,6 +474,9 @@ hgvs_tests = (
                   'sequence': 'CGAGG',
                   'type': 'ReferenceLengthExpression'}}),
 )
+# validate the expected payloads into Allele models once at import, as for
+# the case tables above
+hgvs_tests = tuple((expr, _allele(expected)) for expr, expected in hgvs_tests)
 
 hgvs_tests_to_hgvs_map = {
     "NC_000019.10:g.289464_289465insCACA": "NC_000019.10:g.289466_289467insCACA",
@@ -442,13 +484,13 @@ hgvs_tests_to_hgvs_map = {
 }
 
 
-@pytest.mark.parametrize("hgvsexpr,expected", hgvs_tests)
+@pytest.mark.parametrize("hgvsexpr,expected", hgvs_tests, ids=[t[0] for t in hgvs_tests])
 @pytest.mark.vcr
 def test_hgvs(tlr, hgvsexpr, expected):
     # do_normalize defaults to true
     tlr.identify = True
     allele = tlr.translate_from(hgvsexpr, "hgvs")
-    assert allele.model_dump(exclude_none=True) == expected
+    assert allele == expected
 
     to_hgvs = tlr.translate_to(allele, "hgvs")
     assert (hgvsexpr in to_hgvs) or (hgvs_tests_to_hgvs_map.get(hgvsexpr, hgvsexpr) in to_hgvs)
@@ -476,17 +518,24 @@ def test_rle_seq_limit(tlr):
 
     # use default rle_seq_limit
     allele_no_seq = tlr.translate_from(input_hgvs_expr, fmt="hgvs")
-    assert allele_no_seq.model_dump(exclude_none=True) == a_dict
+    dumped_no_seq = allele_no_seq.model_dump(exclude_none=True)
+    assert dumped_no_seq == a_dict
 
     with pytest.raises(AttributeError, match="'NoneType' object has no attribute 'root'"):
         tlr.translate_to(allele_no_seq, "hgvs")
 
-    # set rle_seq_limit to None
+    # set rle_seq_limit to None; replace the state without aliasing a_dict's
+    # nested dict (a shallow .copy() would share and mutate it)
     allele_with_seq = tlr.translate_from(input_hgvs_expr, fmt="hgvs", rle_seq_limit=None)
-    a_dict_with_seq = a_dict.copy()
-    a_dict_with_seq["state"][
-        "sequence"] = "TTTAGTTGAACTACAGGTTTTTTTGTTGTTGTTGTTTTGATTTTTTTTTTTTTTTAGTTGAACTACAGGTTTTTTTGTTGTTGTTGTTTTGATTTTTTTTTTTT"
-    assert allele_with_seq.model_dump(exclude_none=True) == a_dict_with_seq
+    a_dict_with_seq = {
+        **a_dict,
+        "state": {
+            **a_dict["state"],
+            "sequence": "TTTAGTTGAACTACAGGTTTTTTTGTTGTTGTTGTTTTGATTTTTTTTTTTTTTTAGTTGAACTACAGGTTTTTTTGTTGTTGTTGTTTTGATTTTTTTTTTTT",
+        },
+    }
+    dumped_with_seq = allele_with_seq.model_dump(exclude_none=True)
+    assert dumped_with_seq == a_dict_with_seq
 
     output_hgvs_expr = tlr.translate_to(allele_with_seq, "hgvs")
     assert output_hgvs_expr == [input_hgvs_expr]
@@ -3,6 +3,11 @@ import pytest
 from ga4gh.vrs import models
 from ga4gh.vrs.extras.translator import CnvTranslator
 
+# these modules share the session rest_dataproxy, whose lru caches (and
+# therefore cassette contents) assume collection order; keep them on one
+# xdist worker under --dist=loadgroup
+pytestmark = pytest.mark.xdist_group("seqrepo_rest")
+
 
 @pytest.fixture(scope="module")
 def tlr(rest_dataproxy):
@@ -74,7 +79,7 @@ from_hgvs_cx_tests = (
 def test_from_hgvs_cx(tlr, hgvsexpr ,copy_change, expected):
     """test that _from_hgvs works correctly for copy number change"""
     cx = tlr._from_hgvs(hgvsexpr, copy_change=copy_change)
-    assert cx.model_dump(exclude_none=True) == expected
+    assert cx == models.CopyNumberChange.model_validate(expected)
 
 
 from_hgvs_cn_tests = (
@@ -112,4 +117,4 @@ from_hgvs_cn_tests = (
 def test_from_hgvs_cn(tlr, hgvsexpr ,copies, expected):
     """test that _from_hgvs works correctly for copy number count"""
     cn = tlr._from_hgvs(hgvsexpr, copies=copies)
-    assert cn.model_dump(exclude_none=True) == expected
+    assert cn == models.CopyNumberCount.model_validate(expected)
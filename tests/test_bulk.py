@@ -0,0 +1,47 @@
+from ga4gh.core._bulk import ExtensionsTable, MappingsTable
+from ga4gh.core.entity_models import Coding, ConceptMapping, Extension
+
+
+def test_extensions_table_round_trip():
+    extensions = [
+        Extension(name="allele frequency", value=0.000132),
+        Extension(name="notes", value="seen in gnomAD", description="curator note"),
+        Extension(name="flags", value=["lc", "nc"]),
+    ]
+
+    table = ExtensionsTable.from_aos(extensions)
+    assert len(table) == 3
+    assert table.names == ["allele frequency", "notes", "flags"]
+    assert table.values == [0.000132, "seen in gnomAD", ["lc", "nc"]]
+    assert table.descriptions == [None, "curator note", None]
+    assert table.to_aos() == extensions
+
+    assert len(ExtensionsTable()) == 0
+    assert ExtensionsTable().to_aos() == []
+
+
+def test_mappings_table_round_trip():
+    mappings = [
+        ConceptMapping(
+            coding=Coding(code="ENSG00000139618", system="https://www.ensembl.org/"),
+            relation="exactMatch",
+        ),
+        ConceptMapping(
+            coding=Coding(
+                code="HGNC:1101",
+                system="https://www.genenames.org/",
+                label="BRCA2",
+                version="2024-01",
+            ),
+            relation="relatedMatch",
+        ),
+    ]
+
+    table = MappingsTable.from_aos(mappings)
+    assert len(table) == 2
+    assert table.codes == ["ENSG00000139618", "HGNC:1101"]
+    assert table.systems == ["https://www.ensembl.org/", "https://www.genenames.org/"]
+    assert table.labels == [None, "BRCA2"]
+    assert table.versions == [None, "2024-01"]
+    assert table.relations == ["exactMatch", "relatedMatch"]
+    assert table.to_aos() == mappings
@@ -0,0 +1,74 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from ga4gh.core import blake2t24u, sha512t24u, sha512t24u_24, sha512t24u_many
+
+ACGT_DIGEST = "aKF498dAxcJAqme6QYQ7EZ07-fiw8Kw2"
+EMPTY_DIGEST = "z4PhNX7vuL3xVChQ1m2AB9Yg5AULVxXc"
+
+
+@pytest.mark.parametrize("digest_fn", (sha512t24u, sha512t24u_24))
+def test_sha512t24u_accepts_bytes_like(digest_fn):
+    # the memo only applies to hashable bytes; bytearray/memoryview inputs
+    # must still digest identically regardless of size
+    assert digest_fn(b"ACGT") == ACGT_DIGEST
+    assert digest_fn(bytearray(b"ACGT")) == ACGT_DIGEST
+    assert digest_fn(memoryview(b"ACGT")) == ACGT_DIGEST
+
+    big = b"ACGT" * 2048    # over the memo size cutoff
+    assert digest_fn(bytearray(big)) == digest_fn(big)
+
+
+@pytest.mark.parametrize("workers", (None, 2))
+def test_sha512t24u_many(workers):
+    # both the serial comprehension and the thread-pool path must agree
+    # with the per-blob function on known vectors
+    blobs = [b"", b"ACGT", b"ACGT" * 2048]
+    expected = [EMPTY_DIGEST, ACGT_DIGEST, sha512t24u(b"ACGT" * 2048)]
+    assert sha512t24u_many(blobs, workers=workers) == expected
+    assert sha512t24u_many([], workers=workers) == []
+
+
+def test_blake2t24u_vectors():
+    assert blake2t24u(b"") == "qztTMacTXtUNDxgtAm5gq9s2Rv1RvPij"
+    assert blake2t24u(b"ACGT") == "qLw9xwGx8yem3DPEuSCQyxssM1FlL7bz"
+
+
+def _digest_blob_in_subprocess(backend):
+    """Import ga4gh.core with GA4GH_DIGEST_BACKEND set and digest b'ACGT'.
+
+    The backend is bound once at import, so selection has to be exercised
+    in a fresh interpreter.
+    """
+    env = dict(os.environ)
+    if backend is None:
+        env.pop("GA4GH_DIGEST_BACKEND", None)
+    else:
+        env["GA4GH_DIGEST_BACKEND"] = backend
+    return subprocess.run(
+        [sys.executable, "-c",
+         "from ga4gh.core import digest_blob; print(digest_blob(b'ACGT'), end='')"],
+        env=env, capture_output=True, text=True
+    )
+
+
+@pytest.mark.parametrize("backend,expected", [
+    (None, ACGT_DIGEST),
+    ("sha512t24u", ACGT_DIGEST),
+    ("blake2b", "qLw9xwGx8yem3DPEuSCQyxssM1FlL7bz"),
+])
+def test_digest_blob_backend_selection(backend, expected):
+    result = _digest_blob_in_subprocess(backend)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == expected
+
+
+def test_digest_blob_invalid_backend():
+    result = _digest_blob_in_subprocess("md5")
+    assert result.returncode != 0
+    assert "ValueError" in result.stderr
+    assert "GA4GH_DIGEST_BACKEND" in result.stderr
+    assert "blake2b" in result.stderr and "sha512t24u" in result.stderr
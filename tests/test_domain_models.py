@@ -0,0 +1,61 @@
+import pytest
+
+from ga4gh.core.domain_models import (
+    CombinationTherapy,
+    Condition,
+    Disease,
+    Phenotype,
+    TherapeuticAgent,
+    TherapeuticProcedure,
+    TherapeuticSubstituteGroup,
+    TraitSet,
+)
+
+condition_dicts = [
+    {"type": "Disease", "id": "d1", "label": "a disease"},
+    {"type": "Phenotype", "id": "p1"},
+    {"type": "TraitSet",
+     "traits": [{"type": "Disease", "id": "d1"},
+                {"type": "Phenotype", "id": "p1", "label": "a phenotype"}]},
+]
+
+procedure_dicts = [
+    {"type": "TherapeuticAgent", "id": "a1", "label": "an agent"},
+    {"type": "TherapeuticAction", "id": "a2"},
+    {"type": "TherapeuticSubstituteGroup",
+     "substitutes": [{"type": "TherapeuticAgent", "id": "a1"},
+                     {"type": "TherapeuticAction", "id": "a2"}]},
+    {"type": "CombinationTherapy",
+     "components": [{"type": "TherapeuticSubstituteGroup",
+                     "substitutes": [{"type": "TherapeuticAgent", "id": "a1"},
+                                     {"type": "TherapeuticAgent", "id": "a3"}]},
+                    {"type": "TherapeuticAction", "id": "a2"}]},
+]
+
+
+@pytest.mark.parametrize("cls,d", (
+    [(Condition, d) for d in condition_dicts]
+    + [(TherapeuticProcedure, d) for d in procedure_dicts]
+), ids=lambda v: v["type"] if isinstance(v, dict) else v.__name__)
+def test_from_trusted_dict_matches_model_validate(cls, d):
+    """The trusted fast path must be indistinguishable from full validation
+    for known-good input, so a dispatch-dict or model_construct regression
+    shows up as a dump mismatch."""
+    trusted = cls.from_trusted_dict(d)
+    validated = cls.model_validate(d)
+    assert type(trusted.root) is type(validated.root)
+    assert trusted.model_dump() == validated.model_dump()
+    assert (trusted.model_dump(exclude_none=True)
+            == validated.model_dump(exclude_none=True))
+
+
+def test_from_trusted_dict_nested_member_selection():
+    condition = Condition.from_trusted_dict(condition_dicts[2])
+    assert type(condition.root) is TraitSet
+    assert [type(t) for t in condition.root.traits] == [Disease, Phenotype]
+
+    procedure = TherapeuticProcedure.from_trusted_dict(procedure_dicts[3])
+    assert type(procedure.root) is CombinationTherapy
+    group, action = procedure.root.components
+    assert type(group) is TherapeuticSubstituteGroup
+    assert all(type(s) is TherapeuticAgent for s in group.substitutes)
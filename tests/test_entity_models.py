@@ -0,0 +1,42 @@
+import pydantic
+import pytest
+
+from ga4gh.core.entity_models import IRI, Code, Coding, ConceptMapping, Extension
+
+
+def test_leaf_models_are_frozen_and_hashable():
+    """The leaf value classes are frozen so bulk workflows can dedupe and
+    cache them; equal values must hash equally, including through the
+    nested Code root model."""
+    coding = Coding(code="ENSG00000139618", system="https://www.ensembl.org/")
+    same = Coding(code="ENSG00000139618", system="https://www.ensembl.org/")
+    mapping = ConceptMapping(coding=coding, relation="exactMatch")
+    extension = Extension(name="notes", value="x")
+
+    assert hash(Code("ENSG00000139618")) == hash(Code("ENSG00000139618"))
+    assert hash(coding) == hash(same)
+    assert {coding, same} == {coding}
+    assert hash(mapping) == hash(ConceptMapping(coding=same, relation="exactMatch"))
+    assert hash(extension) == hash(Extension(name="notes", value="x"))
+
+    with pytest.raises(pydantic.ValidationError):
+        coding.system = "elsewhere"
+    with pytest.raises(pydantic.ValidationError):
+        Code("ENSG00000139618").root = "other"
+
+
+def test_iri_caches_follow_root():
+    """IRI memoizes its hash and ga4gh_serialize digest per root value;
+    repeat calls must return the cached result and a root reassignment
+    must invalidate both caches."""
+    iri = IRI("ga4gh:VA.aKF498dAxcJAqme6QYQ7EZ07-fiw8Kw2")
+    assert hash(iri) == hash(iri) == hash(iri.root)
+    assert iri.ga4gh_serialize() == "aKF498dAxcJAqme6QYQ7EZ07-fiw8Kw2"
+    # second call takes the cache-hit branch
+    assert iri.ga4gh_serialize() == "aKF498dAxcJAqme6QYQ7EZ07-fiw8Kw2"
+
+    iri.root = "#/location/1"
+    assert hash(iri) == hash("#/location/1")
+    # non-ga4gh references serialize as-is
+    assert iri.ga4gh_serialize() == "#/location/1"
+    assert iri.ga4gh_serialize() == "#/location/1"
@@ -0,0 +1,38 @@
+import pytest
+
+import ga4gh.core.pydantic
+from ga4gh.core import model_dump_json_fast, pydantic_construct
+from ga4gh.core.entity_models import Code, Coding, Extension
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def dump_branch(request, monkeypatch):
+    """Run a test under both serializer branches; the fallback must stay
+    byte-compatible with the orjson path even when orjson is installed."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(ga4gh.core.pydantic, "orjson", None)
+    elif ga4gh.core.pydantic.orjson is None:    # pragma: no cover
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+def test_model_dump_json_fast(dump_branch):
+    extension = Extension(name="notes", value="x")
+
+    dumped = model_dump_json_fast(extension)
+    assert isinstance(dumped, bytes)
+    assert dumped == b'{"name":"notes","value":"x"}'
+
+    assert (model_dump_json_fast(extension, exclude_none=False)
+            == b'{"name":"notes","value":"x","description":null}')
+
+
+def test_pydantic_construct():
+    # field values must already be validated (incl. nested models);
+    # construction skips coercion as well as validation
+    coding = pydantic_construct(Coding, code=Code("ENSG00000139618"),
+                                system="https://www.ensembl.org/")
+    assert coding == Coding(code="ENSG00000139618",
+                            system="https://www.ensembl.org/")
+    with pytest.raises(RuntimeError):
+        pydantic_construct(dict, code="ENSG00000139618")
@@ -1,5 +1,10 @@
 import pytest
 
+# shares the session rest_dataproxy with the translator tests; its lru
+# caches (and therefore cassette contents) assume collection order, so
+# keep these on one xdist worker under --dist=loadgroup
+pytestmark = pytest.mark.xdist_group("seqrepo_rest")
+
 
 @pytest.mark.vcr
 def test_vcrtest(rest_dataproxy):
@@ -1,6 +1,12 @@
 import pytest
 from ga4gh.vrs import models, normalize
 
+# shares the session rest_dataproxy with the translator tests; its lru
+# caches (and therefore cassette contents) assume collection order, so
+# keep these on one xdist worker under --dist=loadgroup
+pytestmark = pytest.mark.xdist_group("seqrepo_rest")
+
+
 # >>> dp.get_sequence("refseq:NC_000019.10", 44908820, 44908830)
 #  |820      |825      | 830
 # ' G C G C C T G G C A '